@@ -4,10 +4,35 @@ Conference-specific build script for RSI presentation
 """
 
 import argparse
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
+
+# Conference configurations
+CONFERENCES = MappingProxyType({
+    "react-summit": {
+        "name": "React Summit",
+        "config": "slides/config-react-summit.yaml",
+        "output_dir": "dist/react-summit",
+        "description": "Premium international conference - enterprise focus"
+    },
+    "react-advanced": {
+        "name": "React Advanced London",
+        "config": "slides/config-react-advanced.yaml", 
+        "output_dir": "dist/react-advanced",
+        "description": "Technical deep-dive conference"
+    },
+    "local-meetup": {
+        "name": "Local React Meetup",
+        "config": "slides/config-local-meetup.yaml",
+        "output_dir": "dist/local-meetup", 
+        "description": "Accessible local presentation"
+    }
+})
 
 
 def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -16,6 +41,59 @@ def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProce
     return subprocess.run(cmd, check=check, capture_output=True, text=True)
 
 
+def _newest_mtime_ns(path: str) -> int:
+    """Get the most recent mtime of a directory tree, in nanoseconds."""
+    newest = os.stat(path).st_mtime_ns
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                newest = max(newest, _newest_mtime_ns(entry.path))
+            else:
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+
+def _fast_copytree(src: str, dst: str) -> None:
+    """Mirror src into dst, hardlinking files and copying only where linking fails.
+
+    Symlinks are followed and directory permissions copied, like
+    shutil.copytree's defaults.
+    """
+    os.makedirs(dst, exist_ok=True)
+    shutil.copymode(src, dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+                continue
+            source = os.path.realpath(entry.path)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+
+def sync_assets(src: Path, dst: Path) -> bool:
+    """Update dst from src unless it is already newer; return True if copied.
+
+    The tree is built in a temporary sibling directory and moved into place
+    only once complete, so an interrupted copy never leaves a partial dst.
+    """
+    if dst.exists() and _newest_mtime_ns(str(src)) <= os.stat(dst).st_mtime_ns:
+        return False
+    staging = tempfile.mkdtemp(prefix=f".{dst.name}-", dir=dst.parent)
+    try:
+        _fast_copytree(str(src), staging)
+        if dst.exists():
+            shutil.rmtree(dst)
+        os.replace(staging, dst)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return True
+
+
 def build_presentation(conference: str) -> None:
     """Build presentation for specific conference."""
     
@@ -26,27 +104,7 @@ def build_presentation(conference: str) -> None:
         print("❌ Slides file not found at slides/main.md")
         sys.exit(1)
     
-    # Conference configurations
-    conferences = {
-        "react-summit": {
-            "name": "React Summit",
-            "config": "slides/config-react-summit.yaml",
-            "output_dir": "dist/react-summit",
-            "description": "Premium international conference - enterprise focus"
-        },
-        "react-advanced": {
-            "name": "React Advanced London",
-            "config": "slides/config-react-advanced.yaml", 
-            "output_dir": "dist/react-advanced",
-            "description": "Technical deep-dive conference"
-        },
-        "local-meetup": {
-            "name": "Local React Meetup",
-            "config": "slides/config-local-meetup.yaml",
-            "output_dir": "dist/local-meetup", 
-            "description": "Accessible local presentation"
-        }
-    }
+    conferences = CONFERENCES
     
     if conference not in conferences:
         print(f"❌ Unknown conference: {conference}")
@@ -82,11 +140,10 @@ def build_presentation(conference: str) -> None:
         # Copy assets if they exist
         assets_dir = project_root / "assets"
         if assets_dir.exists():
-            target_assets = output_dir / "assets"
-            if target_assets.exists():
-                shutil.rmtree(target_assets)
-            shutil.copytree(assets_dir, target_assets)
-            print("📁 Assets copied")
+            if sync_assets(assets_dir, output_dir / "assets"):
+                print("📁 Assets copied")
+            else:
+                print("📁 Assets up to date")
         
         print(f"📦 Conference build ready: {output_dir}")
         print(f"🌐 Open: {output_file}")
@@ -112,7 +169,7 @@ def main():
     parser.add_argument(
         "--conference", 
         required=True,
-        choices=["react-summit", "react-advanced", "local-meetup"],
+        choices=list(CONFERENCES),
         help="Conference type to build for"
     )
     
@@ -6,34 +6,201 @@ Professional presentation management with mkslides
 Requires Python 3.12+ for mkslides compatibility
 """
 
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-# Check Python version compatibility
-if sys.version_info < (3, 12):
-    print("❌ Python 3.12+ required for mkslides compatibility")
-    print(f"Current version: {sys.version}")
-    print("Please upgrade Python or use a compatible version")
-    sys.exit(1)
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="rsi-slides",
     help="React Service Injection Conference Presentation CLI",
     no_args_is_help=True,
 )
-console = Console()
+
+
+@functools.cache
+def get_console() -> Console:
+    """Get the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SLIDES_FILE = PROJECT_ROOT / "slides" / "main.md"
 
 
 def get_project_root() -> Path:
     """Get the project root directory."""
-    return Path(__file__).parent.parent.parent
+    return PROJECT_ROOT
+
+
+# Slide separators, code fences, image and link openers in one alternation
+SLIDE_TOKENS = re.compile(r"---|```|!\[|\]\(")
+SCAN_CHUNK_SIZE = 1 << 16
+
+
+@dataclass(frozen=True)
+class SlideStats:
+    """Counts gathered from a single pass over the slides file."""
+
+    slides: int
+    lines: int
+    chars: int
+    code_fences: int
+    images: int
+    links: int
+    size: int
+
+
+@functools.lru_cache(maxsize=4)
+def _load_slides(path: str, mtime_ns: int, size: int) -> SlideStats:
+    """Scan the slides file once; cached until its mtime or size changes.
+
+    The file is streamed in chunks so large decks are never held in memory
+    as a single string. Each chunk is matched up to its last newline and
+    the rest carried over; no token spans a newline, so the counts equal a
+    scan of the whole file.
+    """
+    counts: Counter[str] = Counter()
+    newlines = chars = 0
+    pending: list[str] = []
+    with open(path) as f:
+        while chunk := f.read(SCAN_CHUNK_SIZE):
+            chars += len(chunk)
+            newlines += chunk.count("\n")
+            cut = chunk.rfind("\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            counts.update(SLIDE_TOKENS.findall("".join(pending)))
+            pending = [chunk[cut:]]
+    counts.update(SLIDE_TOKENS.findall("".join(pending)))
+    return SlideStats(
+        slides=counts["---"] + 1,
+        lines=newlines + 1,
+        chars=chars,
+        code_fences=counts["```"],
+        images=counts["!["],
+        links=counts["]("],
+        size=size,
+    )
+
+
+def load_slide_stats(slides_file: Path) -> SlideStats:
+    """Get statistics for the slides file, reusing a cached scan if unchanged."""
+    stat = slides_file.stat()
+    return _load_slides(str(slides_file), stat.st_mtime_ns, stat.st_size)
+
+
+def _newest_mtime_ns(path: str) -> int:
+    """Get the most recent mtime of a directory tree, in nanoseconds."""
+    newest = os.stat(path).st_mtime_ns
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                newest = max(newest, _newest_mtime_ns(entry.path))
+            else:
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+
+def _fast_copytree(src: str, dst: str) -> None:
+    """Mirror src into dst, hardlinking files and copying only where linking fails.
+
+    Symlinks are followed and directory permissions copied, like
+    shutil.copytree's defaults.
+    """
+    os.makedirs(dst, exist_ok=True)
+    shutil.copymode(src, dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _fast_copytree(entry.path, target)
+                continue
+            source = os.path.realpath(entry.path)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+
+def sync_assets(src: Path, dst: Path) -> bool:
+    """Update dst from src unless it is already newer; return True if copied.
+
+    The tree is built in a temporary sibling directory and moved into place
+    only once complete, so an interrupted copy never leaves a partial dst.
+    """
+    if dst.exists() and _newest_mtime_ns(str(src)) <= os.stat(dst).st_mtime_ns:
+        return False
+    staging = tempfile.mkdtemp(prefix=f".{dst.name}-", dir=dst.parent)
+    try:
+        _fast_copytree(str(src), staging)
+        if dst.exists():
+            shutil.rmtree(dst)
+        os.replace(staging, dst)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return True
+
+
+def run_mkslides(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+    """Run mkslides in-process via its console entry point.
+
+    The in-process call swaps the process-wide ``sys.argv`` and working
+    directory, so it is only used from the main thread; worker threads (the
+    parallel export, watch rebuilds) and installs without an entry point run
+    mkslides as a subprocess. Either way it writes directly to the terminal.
+    Exceptions escaping in-process mkslides are reported and returned as
+    ``returncode`` 1, so only a failed subprocess spawn raises.
+    """
+    from importlib.metadata import entry_points
+
+    cmd = ["mkslides", *args]
+    if threading.current_thread() is not threading.main_thread():
+        return subprocess.run(cmd, cwd=cwd)
+    matches = entry_points(group="console_scripts", name="mkslides")
+    if not matches:
+        return subprocess.run(cmd, cwd=cwd)
+    
+    mkslides_main = next(iter(matches)).load()
+    returncode = 0
+    saved_argv = sys.argv
+    sys.argv = cmd
+    try:
+        with contextlib.chdir(cwd):
+            mkslides_main()
+    except SystemExit as exc:
+        if exc.code is not None:
+            returncode = exc.code if isinstance(exc.code, int) else 1
+    except Exception as exc:
+        # Report like a crashed mkslides process would, as a failed run
+        get_console().print(f"[red]mkslides error: {exc!r}[/red]")
+        returncode = 1
+    finally:
+        sys.argv = saved_argv
+    return subprocess.CompletedProcess(cmd, returncode)
 
 
 @app.command()
@@ -43,17 +210,19 @@ def serve(
     watch: bool = typer.Option(True, "--watch/--no-watch", help="Enable live reload"),
 ) -> None:
     """Start the presentation server with live reload."""
+    from rich.panel import Panel
+
     project_root = get_project_root()
-    slides_file = project_root / "slides" / "main.md"
+    slides_file = SLIDES_FILE
     
-    if not slides_file.exists():
-        console.print(
+    if not os.path.isfile(slides_file):
+        get_console().print(
             "[red]❌ Slides file not found at slides/main.md[/red]",
             style="bold"
         )
         raise typer.Exit(1)
     
-    console.print(
+    get_console().print(
         Panel.fit(
             f"🚀 Starting RSI Presentation Server\n"
             f"📱 URL: http://{host}:{port}\n"
@@ -64,6 +233,8 @@ def serve(
         )
     )
     
+    # Long-running, so startup cost is irrelevant; a subprocess also lets
+    # Ctrl+C reach the KeyboardInterrupt handler below
     cmd = ["mkslides", "serve", str(slides_file), "--port", str(port), "--host", host]
     if watch:
         cmd.append("--watch")
@@ -71,7 +242,7 @@ def serve(
     try:
         subprocess.run(cmd, cwd=project_root)
     except KeyboardInterrupt:
-        console.print("\n[yellow]👋 Server stopped[/yellow]")
+        get_console().print("\n[yellow]👋 Server stopped[/yellow]")
 
 
 @app.command()
@@ -85,10 +256,10 @@ def build(
 ) -> None:
     """Build the presentation."""
     project_root = get_project_root()
-    slides_file = project_root / "slides" / "main.md"
+    slides_file = SLIDES_FILE
     
-    if not slides_file.exists():
-        console.print("[red]❌ Slides file not found[/red]")
+    if not os.path.isfile(slides_file):
+        get_console().print("[red]❌ Slides file not found[/red]")
         raise typer.Exit(1)
     
     # Determine output path
@@ -100,11 +271,11 @@ def build(
     
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    console.print(f"🏗️  Building presentation...")
-    console.print(f"📁 Input: {slides_file}")
-    console.print(f"📁 Output: {output}")
+    get_console().print(f"🏗️  Building presentation...")
+    get_console().print(f"📁 Input: {slides_file}")
+    get_console().print(f"📁 Output: {output}")
     
-    cmd = ["mkslides", "build", str(slides_file), "--output", str(output)]
+    args = ["build", str(slides_file), "--output", str(output)]
     
     # Add conference-specific config if available
     config_file = project_root / "slides" / "config.yaml"
@@ -114,31 +285,63 @@ def build(
             config_file = conference_config
     
     if config_file.exists():
-        cmd.extend(["--config", str(config_file)])
-        console.print(f"⚙️  Config: {config_file}")
+        args.extend(["--config", str(config_file)])
+        get_console().print(f"⚙️  Config: {config_file}")
     
+    # Only spawning the fallback subprocess can raise FileNotFoundError here;
+    # errors inside in-process mkslides come back as a nonzero returncode
+    try:
+        result = run_mkslides(args, cwd=project_root)
+    except FileNotFoundError:
+        get_console().print("[red]❌ mkslides not found. Install with: uv sync[/red]")
+        raise typer.Exit(1)
+    
+    if result.returncode != 0:
+        get_console().print(f"[red]❌ Build failed (exit code {result.returncode})[/red]")
+        raise typer.Exit(1)
+    
+    get_console().print("[green]✅ Build successful![/green]")
+    
+    # Copy assets if they exist
+    assets_dir = project_root / "assets"
+    if assets_dir.exists():
+        if sync_assets(assets_dir, output.parent / "assets"):
+            get_console().print("📁 Assets copied")
+        else:
+            get_console().print("📁 Assets up to date")
+
+
+# Descriptions shown for known files in the exported conference package
+PACKAGE_FILE_PURPOSES = {
+    "index.html": "Main presentation",
+    "rsi-presentation-backup.pdf": "PDF backup",
+    "conference-checklist.md": "Pre-presentation checklist",
+}
+
+
+def _export_html(output_dir: Path) -> None:
+    """Build the HTML version of the conference package."""
+    build(output=output_dir / "index.html", conference=None)
+    get_console().print("✅ HTML export complete")
+
+
+def _export_pdf(project_root: Path, output_dir: Path) -> None:
+    """Generate the optional PDF backup of the conference package."""
+    pdf_output = output_dir / "rsi-presentation-backup.pdf"
     try:
-        result = subprocess.run(cmd, cwd=project_root, capture_output=True, text=True)
+        result = subprocess.run([
+            "mkslides", "export", 
+            str(SLIDES_FILE),
+            "--output", str(pdf_output),
+            "--format", "pdf"
+        ], cwd=project_root, capture_output=True, text=True)
+        
         if result.returncode == 0:
-            console.print("[green]✅ Build successful![/green]")
-            
-            # Copy assets if they exist
-            assets_dir = project_root / "assets"
-            if assets_dir.exists():
-                import shutil
-                target_assets = output.parent / "assets"
-                if target_assets.exists():
-                    shutil.rmtree(target_assets)
-                shutil.copytree(assets_dir, target_assets)
-                console.print("📁 Assets copied")
-                
+            get_console().print("✅ PDF export complete")
         else:
-            console.print(f"[red]❌ Build failed: {result.stderr}[/red]")
-            raise typer.Exit(1)
-            
+            get_console().print("[yellow]⚠️  PDF export failed (optional)[/yellow]")
     except FileNotFoundError:
-        console.print("[red]❌ mkslides not found. Install with: uv sync[/red]")
-        raise typer.Exit(1)
+        get_console().print("[yellow]⚠️  PDF export requires additional dependencies[/yellow]")
 
 
 @app.command()
@@ -147,136 +350,123 @@ def export(
     output_dir: Path = typer.Option(Path("export"), "--output-dir", "-d", help="Output directory"),
 ) -> None:
     """Export presentation for conference delivery."""
+    from rich.table import Table
+
     project_root = get_project_root()
     output_dir = project_root / output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    console.print("📦 Exporting conference package...")
-    
-    if format in ("html", "all"):
-        # Build HTML version
-        html_output = output_dir / "index.html"
-        build(output=html_output)
-        console.print("✅ HTML export complete")
-    
-    if format in ("pdf", "all"):
-        # Generate PDF backup
-        pdf_output = output_dir / "rsi-presentation-backup.pdf"
-        try:
-            result = subprocess.run([
-                "mkslides", "export", 
-                str(project_root / "slides" / "main.md"),
-                "--output", str(pdf_output),
-                "--format", "pdf"
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                console.print("✅ PDF export complete")
-            else:
-                console.print("[yellow]⚠️  PDF export failed (optional)[/yellow]")
-        except FileNotFoundError:
-            console.print("[yellow]⚠️  PDF export requires additional dependencies[/yellow]")
+    get_console().print("📦 Exporting conference package...")
+    
+    # HTML and PDF are independent mkslides runs writing different files.
+    # For "all", the PDF subprocess runs in a worker while the HTML build
+    # stays on this thread, where run_mkslides can run mkslides in-process.
+    want_html = format in ("html", "all")
+    want_pdf = format in ("pdf", "all")
+    
+    if want_html and want_pdf:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pdf_job = executor.submit(_export_pdf, project_root, output_dir)
+            _export_html(output_dir)
+            pdf_job.result()
+    elif want_html:
+        _export_html(output_dir)
+    elif want_pdf:
+        _export_pdf(project_root, output_dir)
     
     # Create conference checklist
     checklist_file = output_dir / "conference-checklist.md"
     create_conference_checklist(checklist_file)
     
-    console.print(f"[green]✅ Conference package ready in {output_dir}[/green]")
+    get_console().print(f"[green]✅ Conference package ready in {output_dir}[/green]")
     
     # Show package contents
     table = Table(title="Conference Package Contents")
     table.add_column("File", style="cyan")
     table.add_column("Purpose", style="white")
     
-    for file in output_dir.iterdir():
-        if file.is_file():
-            purpose = {
-                "index.html": "Main presentation",
-                "rsi-presentation-backup.pdf": "PDF backup",
-                "conference-checklist.md": "Pre-presentation checklist",
-            }.get(file.name, "Supporting file")
-            table.add_row(file.name, purpose)
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                purpose = PACKAGE_FILE_PURPOSES.get(entry.name, "Supporting file")
+                table.add_row(entry.name, purpose)
     
-    console.print(table)
+    get_console().print(table)
 
 
 @app.command()
 def validate() -> None:
     """Validate presentation content and structure."""
-    project_root = get_project_root()
-    slides_file = project_root / "slides" / "main.md"
+    from rich.table import Table
+
+    slides_file = SLIDES_FILE
     
-    if not slides_file.exists():
-        console.print("[red]❌ Slides file not found[/red]")
+    if not os.path.isfile(slides_file):
+        get_console().print("[red]❌ Slides file not found[/red]")
         raise typer.Exit(1)
     
-    console.print("✅ Validating presentation...")
+    get_console().print("✅ Validating presentation...")
     
     # Read and analyze slides
-    content = slides_file.read_text()
-    slides = content.split("---")
+    slide_stats = load_slide_stats(slides_file)
     
     # Basic validation
     issues = []
     
-    if len(slides) < 10:
+    if slide_stats.slides < 10:
         issues.append("⚠️  Presentation may be too short (< 10 slides)")
     
-    if len(slides) > 50:
+    if slide_stats.slides > 50:
         issues.append("⚠️  Presentation may be too long (> 50 slides)")
     
     # Check for code blocks
-    code_blocks = content.count("```")
+    code_blocks = slide_stats.code_fences
     if code_blocks % 2 != 0:
         issues.append("❌ Unclosed code block detected")
     
-    # Check for images
-    images = content.count("![")
-    
     # Create validation report
     table = Table(title="Presentation Validation Report")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="white")
     table.add_column("Status", style="green")
     
-    table.add_row("Total slides", str(len(slides)), "✅")
+    table.add_row("Total slides", str(slide_stats.slides), "✅")
     table.add_row("Code blocks", str(code_blocks // 2), "✅" if code_blocks % 2 == 0 else "❌")
-    table.add_row("Images", str(images), "✅")
-    table.add_row("File size", f"{slides_file.stat().st_size // 1024}KB", "✅")
+    table.add_row("Images", str(slide_stats.images), "✅")
+    table.add_row("File size", f"{slide_stats.size // 1024}KB", "✅")
     
-    console.print(table)
+    get_console().print(table)
     
     if issues:
-        console.print("\n[yellow]Issues found:[/yellow]")
+        get_console().print("\n[yellow]Issues found:[/yellow]")
         for issue in issues:
-            console.print(f"  {issue}")
+            get_console().print(f"  {issue}")
     else:
-        console.print("\n[green]✅ Validation passed![/green]")
+        get_console().print("\n[green]✅ Validation passed![/green]")
 
 
 @app.command()
 def stats() -> None:
     """Show presentation statistics."""
-    project_root = get_project_root()
-    slides_file = project_root / "slides" / "main.md"
+    from rich.table import Table
+
+    slides_file = SLIDES_FILE
     
-    if not slides_file.exists():
-        console.print("[red]❌ Slides file not found[/red]")
+    if not os.path.isfile(slides_file):
+        get_console().print("[red]❌ Slides file not found[/red]")
         raise typer.Exit(1)
     
-    content = slides_file.read_text()
-    slides = content.split("---")
-    lines = content.split("\n")
+    slide_stats = load_slide_stats(slides_file)
     
     # Calculate statistics
     stats = {
-        "Total slides": len(slides),
-        "Total lines": len(lines),
-        "Total characters": len(content),
-        "Code blocks": content.count("```") // 2,
-        "Images": content.count("!["),
-        "Links": content.count("]("),
-        "Estimated duration": f"{len(slides) * 1.5:.0f} minutes",
+        "Total slides": slide_stats.slides,
+        "Total lines": slide_stats.lines,
+        "Total characters": slide_stats.chars,
+        "Code blocks": slide_stats.code_fences // 2,
+        "Images": slide_stats.images,
+        "Links": slide_stats.links,
+        "Estimated duration": f"{slide_stats.slides * 1.5:.0f} minutes",
     }
     
     table = Table(title="📊 Presentation Statistics")
@@ -286,7 +476,30 @@ def stats() -> None:
     for metric, value in stats.items():
         table.add_row(metric, str(value))
     
-    console.print(table)
+    get_console().print(table)
+
+
+# Audience and format details for each supported conference
+CONFERENCE_CONFIGS = MappingProxyType({
+    "react-summit": {
+        "name": "React Summit",
+        "duration": "45 minutes",
+        "audience": "2000+ senior developers",
+        "focus": "Enterprise scale and performance",
+    },
+    "react-advanced": {
+        "name": "React Advanced London", 
+        "duration": "35 minutes",
+        "audience": "800+ expert developers",
+        "focus": "Deep technical implementation",
+    },
+    "local-meetup": {
+        "name": "Local React Meetup",
+        "duration": "25 minutes", 
+        "audience": "50-200 mixed experience",
+        "focus": "Getting started and practical tips",
+    },
+})
 
 
 @app.command()
@@ -295,38 +508,20 @@ def conference(
     check: bool = typer.Option(False, "--check", help="Run conference-specific validation"),
 ) -> None:
     """Build for specific conference requirements."""
-    
-    conference_configs = {
-        "react-summit": {
-            "name": "React Summit",
-            "duration": "45 minutes",
-            "audience": "2000+ senior developers",
-            "focus": "Enterprise scale and performance",
-        },
-        "react-advanced": {
-            "name": "React Advanced London", 
-            "duration": "35 minutes",
-            "audience": "800+ expert developers",
-            "focus": "Deep technical implementation",
-        },
-        "local-meetup": {
-            "name": "Local React Meetup",
-            "duration": "25 minutes", 
-            "audience": "50-200 mixed experience",
-            "focus": "Getting started and practical tips",
-        },
-    }
+    from rich.panel import Panel
+
+    conference_configs = CONFERENCE_CONFIGS
     
     if name not in conference_configs:
-        console.print(f"[red]❌ Unknown conference: {name}[/red]")
-        console.print("Available conferences:")
+        get_console().print(f"[red]❌ Unknown conference: {name}[/red]")
+        get_console().print("Available conferences:")
         for conf_name in conference_configs:
-            console.print(f"  - {conf_name}")
+            get_console().print(f"  - {conf_name}")
         raise typer.Exit(1)
     
     config = conference_configs[name]
     
-    console.print(
+    get_console().print(
         Panel.fit(
             f"🎯 Building for {config['name']}\n"
             f"⏱️  Duration: {config['duration']}\n"
@@ -341,24 +536,24 @@ def conference(
     build(conference=name)
     
     if check:
-        console.print("\n✅ Running conference-specific validation...")
+        get_console().print("\n✅ Running conference-specific validation...")
         validate()
         
         # Conference-specific checks
         if name == "react-summit":
-            console.print("🔍 Enterprise readiness check...")
-            console.print("✅ Performance metrics included")
-            console.print("✅ ROI analysis present")
+            get_console().print("🔍 Enterprise readiness check...")
+            get_console().print("✅ Performance metrics included")
+            get_console().print("✅ ROI analysis present")
             
         elif name == "react-advanced":
-            console.print("🔍 Technical depth check...")
-            console.print("✅ Architecture deep-dive included")
-            console.print("✅ Advanced patterns covered")
+            get_console().print("🔍 Technical depth check...")
+            get_console().print("✅ Architecture deep-dive included")
+            get_console().print("✅ Advanced patterns covered")
             
         elif name == "local-meetup":
-            console.print("🔍 Accessibility check...")
-            console.print("✅ Beginner-friendly examples")
-            console.print("✅ Step-by-step guides included")
+            get_console().print("🔍 Accessibility check...")
+            get_console().print("✅ Beginner-friendly examples")
+            get_console().print("✅ Step-by-step guides included")
 
 
 @app.command()
@@ -372,35 +567,69 @@ def watch() -> None:
     slides_dir = project_root / "slides"
     
     class SlideHandler(FileSystemEventHandler):
+        # Editors emit several events per save; wait this long for quiet
+        debounce_seconds = 0.3
+        
+        def __init__(self):
+            super().__init__()
+            self._timer: threading.Timer | None = None
+            self._lock = threading.Lock()
+            # Only one rebuild runs at a time; saves during a rebuild mark
+            # the slides dirty so exactly one more rebuild follows
+            self._building = False
+            self._dirty = False
+        
         def on_modified(self, event):
-            if event.src_path.endswith('.md'):
-                console.print("📝 Slides updated, rebuilding...")
-                try:
-                    build()
-                    console.print("[green]✅ Rebuild complete[/green]")
-                except:
-                    console.print("[red]❌ Rebuild failed[/red]")
+            if event.is_directory or not event.src_path.endswith('.md'):
+                return
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self.debounce_seconds, self._schedule_rebuild)
+                self._timer.daemon = True
+                self._timer.start()
+        
+        def _schedule_rebuild(self):
+            with self._lock:
+                if self._building:
+                    self._dirty = True
+                    return
+                self._building = True
+            
+            while True:
+                self._rebuild()
+                with self._lock:
+                    if not self._dirty:
+                        self._building = False
+                        return
+                    self._dirty = False
+        
+        def _rebuild(self):
+            get_console().print("📝 Slides updated, rebuilding...")
+            try:
+                build(output=None, conference=None)
+                get_console().print("[green]✅ Rebuild complete[/green]")
+            except:
+                get_console().print("[red]❌ Rebuild failed[/red]")
     
     event_handler = SlideHandler()
     observer = Observer()
     observer.schedule(event_handler, str(slides_dir), recursive=True)
     observer.start()
     
-    console.print(f"👀 Watching {slides_dir} for changes...")
-    console.print("Press Ctrl+C to stop")
+    get_console().print(f"👀 Watching {slides_dir} for changes...")
+    get_console().print("Press Ctrl+C to stop")
     
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
-        console.print("\n[yellow]👋 Stopped watching[/yellow]")
+        get_console().print("\n[yellow]👋 Stopped watching[/yellow]")
     observer.join()
 
 
-def create_conference_checklist(output_file: Path) -> None:
-    """Create a conference preparation checklist."""
-    checklist = """# Conference Presentation Checklist
+CONFERENCE_CHECKLIST = b"""# Conference Presentation Checklist
 
 ## Pre-Conference (24 hours before)
 - [ ] Test presentation on conference projector resolution
@@ -436,7 +665,11 @@ def create_conference_checklist(output_file: Path) -> None:
 - [ ] Follow up on speaking opportunities
 - [ ] Update presentation based on feedback
 """
-    output_file.write_text(checklist)
+
+
+def create_conference_checklist(output_file: Path) -> None:
+    """Create a conference preparation checklist."""
+    output_file.write_bytes(CONFERENCE_CHECKLIST)
 
 
 def main() -> None: